@@ -0,0 +1,669 @@
+"""
+Resume Generator Benchmarks - Times rendering on synthetic resumes of scaling size
+
+Usage:
+    python benchmark.py                                  # Run all sizes with both engines
+    python benchmark.py --sizes small,large --iterations 20
+    python benchmark.py --engine xml --output results.json
+    python benchmark.py --compare baseline.json          # Diff against an earlier run
+    python benchmark.py --compression                    # Save time and size per zip level
+    python benchmark.py --startup                        # Cold start time against STARTUP_BUDGET_MS
+    python benchmark.py --match                          # Bullet index build, load and query times
+    python benchmark.py --lists                          # Long list sections at LIST_ENTRY_COUNTS entries
+    python benchmark.py --pack [--engine docx]           # Candidate packs of PACK_SIZES resumes
+    python benchmark.py --golden [--update-golden]       # Check output against GOLDEN_FILE hashes
+"""
+
+from pathlib import Path
+import importlib.util
+import tempfile
+import tracemalloc
+import subprocess
+import itertools
+import platform
+import hashlib
+import zipfile
+import random
+import json
+import time
+import sys
+import io
+
+ROOT = Path(__file__).resolve().parent
+
+# ============================================================================
+# BENCHMARK CONFIGURATION
+# ============================================================================
+
+# Number of entries per section for each synthetic resume size - TWEAK HERE
+SIZES = {
+    'small':  {'summary': 2,  'experience': 2,  'bullets': 3,  'projects': 1,  'skills': 3,  'education': 1},
+    'medium': {'summary': 4,  'experience': 4,  'bullets': 5,  'projects': 3,  'skills': 6,  'education': 2},
+    'large':  {'summary': 8,  'experience': 10, 'bullets': 8,  'projects': 6,  'skills': 12, 'education': 4},
+    'xlarge': {'summary': 12, 'experience': 40, 'bullets': 10, 'projects': 20, 'skills': 30, 'education': 10},
+}
+
+DEFAULT_ITERATIONS = 10
+COMPRESSION_LEVELS = [None, 0, 1, 6, 9]   # None = python-docx default
+DEFAULT_OUTPUT = 'bench_results.json'
+
+# Cold start budget per command in ms (interpreter startup included) - TWEAK HERE
+# Measured p50s are about 120-150 ms, most of it compiling the script; the
+# budget leaves headroom for noisy machines and still catches a python-docx
+# import at startup (about +220 ms). The original target was tens of ms.
+STARTUP_BUDGET_MS = 225
+STARTUP_COMMANDS = {
+    'help': ['--help'],
+    'validate': ['--validate-only', 'my_resume_data.json'],
+    'estimate': ['--estimate', 'my_resume_data.json'],
+}
+# Modules that must not be imported by the commands above
+STARTUP_FORBIDDEN = ('docx', 'lxml', 'asyncio', 'multiprocessing')
+
+# Bullet library sizes for --match, and the Zipf-distributed vocabulary they are drawn from - TWEAK HERE
+MATCH_LIBRARY_SIZES = (1000, 10000, 100000)
+MATCH_VOCABULARY = 20000
+MATCH_BULLETS_PER_ENTRY = 10
+
+# Entries in the publications section rendered by --lists - TWEAK HERE
+LIST_ENTRY_COUNTS = (1000, 5000, 10000, 20000)
+
+# Resumes per candidate pack for --pack, each a synthetic resume of PACK_RESUME_SIZE - TWEAK HERE
+PACK_SIZES = (50, 200, 500)
+PACK_RESUME_SIZE = 'medium'
+
+# Hashes of canonical output checked by --golden; refresh with --update-golden after intended changes
+GOLDEN_FILE = 'golden_hashes.json'
+GOLDEN_TEXT_FORMATS = ('pdf', 'html', 'txt', 'md')
+SEED = 1234
+
+# ============================================================================
+
+
+def load_generator_module():
+    """Import resume-generator.py (its hyphenated name is not importable directly)"""
+    spec = importlib.util.spec_from_file_location('resume_generator', ROOT / 'resume-generator.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_synthetic_resume(size, seed=SEED):
+    """Build a resume dict shaped like my_resume_data.json with the given section sizes"""
+    counts = SIZES[size]
+    with open(ROOT / 'my_resume_data.json', 'r', encoding='utf-8') as f:
+        sample = json.load(f)
+
+    # Draw sentences from the words in the sample so text lengths stay realistic
+    words = ' '.join(
+        desc for entry in sample['experience'] + sample['projects'] for desc in entry['description']
+    ).split()
+    rng = random.Random(seed)
+
+    def sentence(low=12, high=28):
+        return ' '.join(rng.choice(words) for _ in range(rng.randint(low, high))).capitalize() + '.'
+
+    def entries(count, template):
+        return [
+            {
+                'title': f"{template[i % len(template)]['title']} {i + 1}",
+                'organization': template[i % len(template)].get('organization', f"Organization {i + 1}"),
+                'dates': template[i % len(template)].get('dates', 'Jan 2000 - Jan 2001'),
+                'description': [sentence() for _ in range(counts['bullets'])],
+            }
+            for i in range(count)
+        ]
+
+    return {
+        'personal': sample['personal'],
+        'summary': [sentence(20, 35) for _ in range(counts['summary'])],
+        'experience': entries(counts['experience'], sample['experience']),
+        'projects': entries(counts['projects'], sample['projects']),
+        'skills': [f"Category {i + 1}: " + ', '.join(rng.sample(words, 6)) for i in range(counts['skills'])],
+        'education': [
+            dict(sample['education'][i % len(sample['education'])], title=f"Degree {i + 1}")
+            for i in range(counts['education'])
+        ],
+    }
+
+
+def render_stages(rg, engine, data, output_file):
+    """Render data one ResumeGenerator stage at a time, yielding (stage, callable)"""
+    state = {}
+    personal = data['personal']
+
+    def construct():
+        state['generator'] = rg.RENDER_ENGINES[engine]()
+
+    yield 'construct', construct
+    yield 'add_header', lambda: state['generator'].add_header(
+        personal['name'], personal['email'], personal['phone'], personal['location'])
+    yield 'add_section:summary', lambda: state['generator'].add_section(
+        "PROFESSIONAL SUMMARY", data['summary'], use_bullets=True)
+    yield 'add_section:experience', lambda: state['generator'].add_section(
+        "PROFESSIONAL EXPERIENCE", data['experience'])
+    yield 'add_section:projects', lambda: state['generator'].add_section("PROJECTS", data['projects'])
+    yield 'add_skills_section', lambda: state['generator'].add_skills_section(data['skills'])
+    yield 'add_education_table', lambda: state['generator'].add_education_table(data['education'])
+    yield 'save', lambda: state['generator'].save(output_file)
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(engine, size, stage, samples, peak_bytes):
+    """Turn raw timings (seconds) into a result record"""
+    mean = sum(samples) / len(samples)
+    return {
+        'engine': engine,
+        'size': size,
+        'stage': stage,
+        'iterations': len(samples),
+        'mean_ms': round(mean * 1000, 3),
+        'p50_ms': round(percentile(samples, 50) * 1000, 3),
+        'p99_ms': round(percentile(samples, 99) * 1000, 3),
+        'throughput_per_s': round(1 / mean, 2) if mean else None,
+        'peak_kb': round(peak_bytes / 1024, 1),
+    }
+
+
+def benchmark_size(rg, engine, size, iterations, workdir):
+    """Time every stage plus end-to-end rendering for one engine and size"""
+    data = make_synthetic_resume(size)
+    json_file = workdir / f"{size}.json"
+    json_file.write_text(json.dumps(data), encoding='utf-8')
+    output_file = str(workdir / f"{size}_{engine}.docx")
+    output_dir = workdir / 'output'
+
+    # Warm up imports and the base document before timing anything
+    for _, run in render_stages(rg, engine, data, output_file):
+        run()
+
+    timings = {}
+    for _ in range(iterations):
+        for stage, run in render_stages(rg, engine, data, output_file):
+            start = time.perf_counter()
+            run()
+            timings.setdefault(stage, []).append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        rg.render_json_file(str(json_file), output_dir=str(output_dir), engine=engine)
+        timings.setdefault('end_to_end', []).append(time.perf_counter() - start)
+
+    # Measure peak memory in a separate pass so tracing does not skew timings
+    peaks = {}
+    tracemalloc.start()
+    for stage, run in render_stages(rg, engine, data, output_file):
+        tracemalloc.reset_peak()
+        run()
+        peaks[stage] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    rg.render_json_file(str(json_file), output_dir=str(output_dir), engine=engine)
+    peaks['end_to_end'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return [summarize(engine, size, stage, samples, peaks[stage]) for stage, samples in timings.items()]
+
+
+def benchmark_compression(rg, engine, iterations):
+    """Time save() to bytes and record the file size for each compression level"""
+    with open(ROOT / 'my_resume_data.json', 'r', encoding='utf-8') as f:
+        samples = {'my_resume_data': json.load(f)}
+    for size in ('small', 'xlarge'):
+        samples[f"synthetic_{size}"] = make_synthetic_resume(size)
+
+    results = []
+    for name, data in samples.items():
+        generator = rg.create_custom_resume(data, engine=engine)
+        for level in COMPRESSION_LEVELS:
+            blob = generator.save(None, compression=level)
+            samples_s = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                generator.save(None, compression=level)
+                samples_s.append(time.perf_counter() - start)
+            results.append({
+                'resume': name,
+                'compression': 'default' if level is None else level,
+                'p50_ms': round(percentile(samples_s, 50) * 1000, 3),
+                'size_kb': round(len(blob) / 1024, 1),
+            })
+    return results
+
+
+def make_bullet_library(bullets, seed=SEED):
+    """Return (master resume with the given number of bullets, job description sampler)
+    
+    Words follow a Zipf distribution over a synthetic vocabulary, like real
+    text, so a few terms are in most bullets and most terms in very few.
+    """
+    rng = random.Random(seed)
+    syllables = ['ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'ti', 'vo', 'ze', 'pa', 'do', 'gu', 'he', 'ji', 'bo', 'fy']
+    vocabulary = sorted({''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+                         for _ in range(MATCH_VOCABULARY * 2)})[:MATCH_VOCABULARY]
+    rng.shuffle(vocabulary)
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def text(count):
+        return ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=count))
+
+    entries = [
+        {
+            'title': f"Engineer {i + 1}",
+            'organization': f"Organization {i + 1}",
+            'dates': 'Jan 2000 - Jan 2001',
+            'description': [text(rng.randint(12, 28)).capitalize() + '.' for _ in range(MATCH_BULLETS_PER_ENTRY)],
+        }
+        for i in range(max(1, bullets // MATCH_BULLETS_PER_ENTRY))
+    ]
+    data = {
+        'personal': {'name': 'Bench Mark'},
+        'experience': entries,
+        'skills': [f"Category {i + 1}: " + text(8) for i in range(20)],
+    }
+    return data, lambda: text(300)
+
+
+def benchmark_match(rg, iterations):
+    """Time building, caching, loading and querying the bullet index at each library size"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in MATCH_LIBRARY_SIZES:
+            data, job_description = make_bullet_library(size)
+            start = time.perf_counter()
+            rg.BulletIndex.build(data)
+            build_s = time.perf_counter() - start
+
+            digest = f"bench_{size}"
+            rg.BulletIndex.cached(data, digest, tmp)
+            start = time.perf_counter()
+            index = rg.BulletIndex.cached(data, digest, tmp)
+            load_s = time.perf_counter() - start
+
+            query_s = []
+            tailor_s = []
+            for _ in range(iterations):
+                job = job_description()
+                start = time.perf_counter()
+                index.scores(index.query_terms(job))
+                query_s.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                rg.tailor_resume(data, job, index)
+                tailor_s.append(time.perf_counter() - start)
+            results.append({
+                'bullets': size,
+                'terms': len(index.postings),
+                'build_ms': round(build_s * 1000, 1),
+                'load_ms': round(load_s * 1000, 1),
+                'query_p50_ms': round(percentile(query_s, 50) * 1000, 2),
+                'tailor_p50_ms': round(percentile(tailor_s, 50) * 1000, 2),
+                'index_kb': round((Path(tmp) / f"{digest}.pickle").stat().st_size / 1024, 1),
+            })
+    return results
+
+
+def print_match_results(results):
+    """Print bullet index results as an aligned table"""
+    print(f"{'bullets':>8} {'terms':>7} {'build ms':>9} {'load ms':>8} {'query ms':>9} {'tailor ms':>10} "
+          f"{'index KB':>9}")
+    print("-" * 66)
+    for r in results:
+        print(f"{r['bullets']:>8} {r['terms']:>7} {r['build_ms']:>9.1f} {r['load_ms']:>8.1f} "
+              f"{r['query_p50_ms']:>9.2f} {r['tailor_p50_ms']:>10.2f} {r['index_kb']:>9.1f}")
+
+
+def make_long_cv(entries, seed=SEED):
+    """Return a resume with a publications section of the given number of entries, a third of them plain text"""
+    rng = random.Random(seed)
+    words = ['Scalable', 'Methods', 'for', 'Sparse', 'Graph', 'Learning', 'in', 'Distributed', 'Systems',
+             'A', 'Study', 'of', 'Robust', 'Optimization', 'Under', 'Noise']
+    publications = []
+    for i in range(entries):
+        title = ' '.join(rng.choices(words, k=rng.randint(6, 14)))
+        if i % 3 == 2:
+            publications.append(f"{title}. Workshop talk, {2000 + i % 25}.")
+        else:
+            publications.append({'title': title, 'organization': f"Journal {i % 97 + 1}",
+                                 'dates': str(2000 + i % 25)})
+    return {'personal': {'name': 'Bench Mark'}, 'publications': publications}
+
+
+def benchmark_lists(rg, engines, iterations):
+    """Time full renders of a long publications list at each size, with per-entry time and memory"""
+    results = []
+    for engine in engines:
+        rg.create_custom_resume(make_long_cv(1), engine=engine)    # build the base document first
+        for entries in LIST_ENTRY_COUNTS:
+            data = make_long_cv(entries)
+            render_s = []
+            save_s = []
+            for _ in range(max(1, iterations // 5)):
+                start = time.perf_counter()
+                generator = rg.create_custom_resume(data, engine=engine)
+                render_s.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                blob = generator.save(None)
+                save_s.append(time.perf_counter() - start)
+
+            # Python-side peak, traced on a separate render so tracing does not skew the times
+            tracemalloc.start()
+            rg.create_custom_resume(data, engine=engine).save(None)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            with zipfile.ZipFile(io.BytesIO(blob)) as package:
+                document_size = package.getinfo('word/document.xml').file_size
+            render = percentile(render_s, 50)
+            results.append({
+                'engine': engine,
+                'entries': entries,
+                'render_ms': round(render * 1000, 1),
+                'us_per_entry': round(render / entries * 1e6, 1),
+                'save_ms': round(percentile(save_s, 50) * 1000, 1),
+                'peak_bytes_per_entry': round(peak / entries),
+                'document_bytes_per_entry': round(document_size / entries),
+            })
+    return results
+
+
+def print_list_results(results):
+    """Print long list results as an aligned table"""
+    print(f"{'engine':>6} {'entries':>8} {'render ms':>10} {'µs/entry':>9} {'save ms':>8} "
+          f"{'peak B/entry':>13} {'xml B/entry':>12}")
+    print("-" * 72)
+    for r in results:
+        print(f"{r['engine']:>6} {r['entries']:>8} {r['render_ms']:>10.1f} {r['us_per_entry']:>9.1f} "
+              f"{r['save_ms']:>8.1f} {r['peak_bytes_per_entry']:>13} {r['document_bytes_per_entry']:>12}")
+
+
+def benchmark_pack(rg, engine):
+    """Time candidate packs with a contents page at each size, against saving every resume on its own"""
+    results = []
+    rg.ResumePack(engine)    # build the base document first
+    resumes = [make_synthetic_resume(PACK_RESUME_SIZE, seed=SEED + i) for i in range(max(PACK_SIZES))]
+    for size in PACK_SIZES:
+        start = time.perf_counter()
+        pack = rg.ResumePack(engine, toc=True)
+        for data in resumes[:size]:
+            pack.add(data)
+        pack.document()
+        render_s = time.perf_counter() - start
+        start = time.perf_counter()
+        blob = pack.save(None)
+        save_s = time.perf_counter() - start
+        results.append({
+            'engine': engine,
+            'resumes': size,
+            'render_ms': round(render_s * 1000, 1),
+            'ms_per_resume': round(render_s / size * 1000, 2),
+            'save_ms': round(save_s * 1000, 1),
+            'pack_kb': round(len(blob) / 1024, 1),
+        })
+
+    # Reference: the same resumes rendered and saved as separate files
+    count = min(PACK_SIZES)
+    start = time.perf_counter()
+    for data in resumes[:count]:
+        rg.create_custom_resume(data, engine=engine).save(None)
+    results.append({'engine': engine, 'resumes': count, 'separate_ms_per_resume':
+                    round((time.perf_counter() - start) / count * 1000, 2)})
+    return results
+
+
+def print_pack_results(results):
+    """Print candidate pack results as an aligned table"""
+    print(f"{'engine':>6} {'resumes':>8} {'render ms':>10} {'ms/resume':>10} {'save ms':>8} {'pack KB':>8}")
+    print("-" * 56)
+    for r in results:
+        if 'separate_ms_per_resume' in r:
+            print(f"Separate files: {r['separate_ms_per_resume']:.2f} ms/resume (render + save)")
+            continue
+        print(f"{r['engine']:>6} {r['resumes']:>8} {r['render_ms']:>10.1f} {r['ms_per_resume']:>10.2f} "
+              f"{r['save_ms']:>8.1f} {r['pack_kb']:>8.1f}")
+
+
+def canonical_document_xml(blob):
+    """Return the C14N form of word/document.xml from .docx bytes"""
+    from lxml import etree
+    with zipfile.ZipFile(io.BytesIO(blob)) as package:
+        return etree.tostring(etree.fromstring(package.read('word/document.xml')), method='c14n')
+
+
+def golden_outputs(rg):
+    """Yield (name, render function) for every output covered by GOLDEN_FILE
+    
+    Word documents are compared by their canonical document.xml, so the
+    hashes do not depend on the zip library; the other formats by their bytes.
+    """
+    with open(ROOT / 'my_resume_data.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for engine in rg.RENDER_ENGINES:
+        yield f"my_resume_data/{engine}", lambda engine=engine: rg.create_custom_resume(data, engine=engine)
+    for fmt in GOLDEN_TEXT_FORMATS:
+        yield f"my_resume_data/{fmt}", lambda fmt=fmt: rg.create_custom_resume(data, output_format=fmt)
+    yield 'create_sample_resume/docx', lambda: rg.create_sample_resume(None)
+
+
+def benchmark_golden(rg):
+    """Render every golden output twice, returning its hash, render time and whether the bytes repeat"""
+    results = []
+    for name, render in golden_outputs(rg):
+        start = time.perf_counter()
+        blob = render().save(None, deterministic=True)
+        elapsed = time.perf_counter() - start
+        repeat = render().save(None, deterministic=True)
+        canonical = canonical_document_xml(blob) if name.endswith(('/docx', '/xml')) else blob
+        results.append({
+            'output': name,
+            'sha256': hashlib.sha256(canonical).hexdigest(),
+            'ms': round(elapsed * 1000, 1),
+            'deterministic': blob == repeat,
+        })
+    return results
+
+
+def print_golden_results(results, golden):
+    """Print golden results against the expected hashes and return False on any mismatch"""
+    ok = True
+    print(f"{'output':<28} {'ms':>7}  status")
+    print("-" * 60)
+    for r in results:
+        expected = golden.get(r['output'])
+        if expected is None:
+            status = "new (run --update-golden)"
+        elif expected == r['sha256']:
+            status = "✓ matches"
+        else:
+            status = f"✗ differs ({r['sha256'][:12]}, expected {expected[:12]})"
+            ok = False
+        if not r['deterministic']:
+            status += ", ✗ not byte-identical between renders"
+            ok = False
+        print(f"{r['output']:<28} {r['ms']:>7.1f}  {status}")
+    return ok
+
+
+def parse_importtime(stderr):
+    """Return ({module: cumulative µs}, {top-level import: cumulative µs}) from python -X importtime output"""
+    modules, top_level = {}, {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.setdefault(name.strip(), int(cumulative))
+        if not name.startswith('  '):     # importtime indents nested imports
+            top_level[name.strip()] = int(cumulative)
+    return modules, top_level
+
+
+def benchmark_startup(iterations):
+    """Time cold starts of the non-rendering commands and record what they import"""
+    results = []
+    for name, command in STARTUP_COMMANDS.items():
+        argv = [sys.executable, str(ROOT / 'resume-generator.py')] + command
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            subprocess.run(argv, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            samples.append(time.perf_counter() - start)
+        traced = subprocess.run([sys.executable, '-X', 'importtime'] + argv[1:], cwd=ROOT,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+        modules, top_level = parse_importtime(traced.stderr)
+        results.append({
+            'command': name,
+            'p50_ms': round(percentile(samples, 50) * 1000, 1),
+            'imports_ms': round(sum(top_level.values()) / 1000, 1),
+            'slowest': sorted(top_level.items(), key=lambda item: -item[1])[:5],
+            'forbidden': [m for m in STARTUP_FORBIDDEN if m in modules],
+        })
+    return results
+
+
+def print_startup_results(results):
+    """Print startup results and return False if any command broke the budget"""
+    ok = True
+    print(f"{'command':<10} {'p50 ms':>8} {'imports ms':>11}  slowest imports (cumulative ms)")
+    print("-" * 79)
+    for r in results:
+        slowest = ', '.join(f"{m} {us / 1000:.1f}" for m, us in r['slowest'])
+        print(f"{r['command']:<10} {r['p50_ms']:>8.1f} {r['imports_ms']:>11.1f}  {slowest}")
+        if r['p50_ms'] > STARTUP_BUDGET_MS:
+            print(f"✗ {r['command']}: {r['p50_ms']} ms is over the {STARTUP_BUDGET_MS} ms budget")
+            ok = False
+        if r['forbidden']:
+            print(f"✗ {r['command']}: imported {', '.join(r['forbidden'])}")
+            ok = False
+    return ok
+
+
+def print_compression_results(results):
+    """Print compression results as an aligned table"""
+    print(f"{'resume':<18} {'level':>8} {'p50 ms':>9} {'size KB':>9}")
+    print("-" * 47)
+    for r in results:
+        print(f"{r['resume']:<18} {str(r['compression']):>8} {r['p50_ms']:>9.2f} {r['size_kb']:>9.1f}")
+
+
+def print_results(results):
+    """Print results as an aligned table"""
+    print(f"{'engine':<6} {'size':<7} {'stage':<24} {'p50 ms':>9} {'p99 ms':>9} {'ops/s':>9} {'peak KB':>9}")
+    print("-" * 79)
+    for r in results:
+        print(f"{r['engine']:<6} {r['size']:<7} {r['stage']:<24} {r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+              f"{r['throughput_per_s']:>9.1f} {r['peak_kb']:>9.1f}")
+
+
+def compare_results(baseline_file, results):
+    """Print the p50 change of each result against a previous results file"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = {
+            (r['engine'], r['size'], r['stage']): r for r in json.load(f)['results']
+        }
+    print(f"\nComparison with {baseline_file} (p50):")
+    print(f"{'engine':<6} {'size':<7} {'stage':<24} {'before':>9} {'after':>9} {'change':>8}")
+    print("-" * 68)
+    for r in results:
+        old = baseline.get((r['engine'], r['size'], r['stage']))
+        if old is None:
+            continue
+        change = (r['p50_ms'] / old['p50_ms'] - 1) * 100 if old['p50_ms'] else 0.0
+        print(f"{r['engine']:<6} {r['size']:<7} {r['stage']:<24} {old['p50_ms']:>9.2f} "
+              f"{r['p50_ms']:>9.2f} {change:>+7.1f}%")
+
+
+def get_option_value(args, flag, default=None):
+    """Return the value that follows flag in args, or default if it is absent"""
+    if flag in args:
+        index = args.index(flag)
+        if index + 1 < len(args):
+            return args[index + 1]
+    return default
+
+
+def main():
+    """Run the benchmark suite from the command line"""
+    args = sys.argv[1:]
+    if '--help' in args or '-h' in args:
+        print(__doc__)
+        return
+
+    iterations = int(get_option_value(args, '--iterations', DEFAULT_ITERATIONS))
+    if '--startup' in args:
+        if not print_startup_results(benchmark_startup(iterations)):
+            sys.exit(1)
+        return
+
+    rg = load_generator_module()
+    if '--match' in args:
+        print_match_results(benchmark_match(rg, iterations))
+        return
+
+    if '--lists' in args:
+        engine = get_option_value(args, '--engine', 'all')
+        engines = list(rg.RENDER_ENGINES) if engine == 'all' else [engine]
+        print_list_results(benchmark_lists(rg, engines, iterations))
+        return
+
+    if '--pack' in args:
+        print_pack_results(benchmark_pack(rg, get_option_value(args, '--engine', 'xml')))
+        return
+
+    if '--golden' in args or '--update-golden' in args:
+        results = benchmark_golden(rg)
+        golden_path = ROOT / GOLDEN_FILE
+        if '--update-golden' in args:
+            with open(golden_path, 'w', encoding='utf-8') as f:
+                json.dump({r['output']: r['sha256'] for r in results}, f, indent=2)
+                f.write('\n')
+            print(f"✓ Golden hashes written to: {golden_path}")
+            return
+        golden = json.loads(golden_path.read_text(encoding='utf-8')) if golden_path.exists() else {}
+        if not print_golden_results(results, golden):
+            sys.exit(1)
+        return
+
+    if '--compression' in args:
+        engine = get_option_value(args, '--engine', 'xml')
+        print_compression_results(benchmark_compression(rg, 'xml' if engine == 'all' else engine, iterations))
+        return
+
+    sizes = get_option_value(args, '--sizes', ','.join(SIZES)).split(',')
+    engine = get_option_value(args, '--engine', 'all')
+    engines = list(rg.RENDER_ENGINES) if engine == 'all' else [engine]
+    output = get_option_value(args, '--output', DEFAULT_OUTPUT)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for engine in engines:
+            for size in sizes:
+                print(f"Benchmarking {engine} / {size} ...", file=sys.stderr)
+                results.extend(benchmark_size(rg, engine, size, iterations, Path(tmp)))
+
+    print_results(results)
+
+    import docx
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'python_docx': getattr(docx, '__version__', 'unknown'),
+            'iterations': iterations,
+            'sizes': {size: SIZES[size] for size in sizes},
+        },
+        'results': results,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to: {output}")
+
+    baseline = get_option_value(args, '--compare')
+    if baseline:
+        compare_results(baseline, results)
+
+
+if __name__ == "__main__":
+    main()
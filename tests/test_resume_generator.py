@@ -0,0 +1,293 @@
+"""
+Behaviour tests for resume-generator.py
+
+Run with: python -m pytest -q
+"""
+
+import copy
+import importlib.util
+import json
+import os
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope='module')
+def rg():
+    """Import resume-generator.py (its hyphenated name is not importable directly)"""
+    spec = importlib.util.spec_from_file_location('resume_generator', ROOT / 'resume-generator.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def resume():
+    with open(ROOT / 'my_resume_data.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ============================================================================
+# OUTPUT MANIFEST
+# ============================================================================
+
+def manifest_lines(rg, output_dir):
+    path = Path(output_dir) / rg.MANIFEST_NAME
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()] if path.exists() else []
+
+
+def test_manifest_numbers_taken_names(rg, tmp_path):
+    manifest = rg.OutputManifest(tmp_path)
+    first = manifest.allocate('Jane_Resume_Acme.docx')
+    second = manifest.allocate('Jane_Resume_Acme.docx')
+    assert (first.name, second.name) == ('Jane_Resume_Acme.docx', 'Jane_Resume_Acme_1.docx')
+    assert first.exists() and second.exists()
+    assert manifest_lines(rg, tmp_path) == []    # nothing is logged until commit()
+
+    manifest.commit(first, 'abc')
+    assert [(r['output'], r['input_sha256']) for r in manifest_lines(rg, tmp_path)] == [
+        ('Jane_Resume_Acme.docx', 'abc')]
+
+
+def test_manifest_release_deletes_file_and_reuses_name(rg, tmp_path):
+    manifest = rg.OutputManifest(tmp_path)
+    manifest.commit(manifest.allocate('a.docx'))
+    failed = manifest.allocate('a.docx')
+    manifest.release(failed)
+    assert not failed.exists()
+    assert manifest.allocate('a.docx').name == 'a_1.docx'
+    assert len(manifest_lines(rg, tmp_path)) == 1
+
+
+def test_manifest_is_shared_between_instances(rg, tmp_path):
+    first = rg.OutputManifest(tmp_path)
+    first.commit(first.allocate('a.docx'))
+    (tmp_path / 'a.docx').unlink()    # the log, not the file on disk, says the name is taken
+    assert rg.OutputManifest(tmp_path).allocate('a.docx').name == 'a_1.docx'
+
+
+def test_reserve_output_path_cleans_up_failed_render(rg, tmp_path):
+    with pytest.raises(RuntimeError):
+        with rg.reserve_output_path(tmp_path, 'b.docx', 'hash') as output_path:
+            raise RuntimeError("render failed")
+    assert not output_path.exists()
+    assert manifest_lines(rg, tmp_path) == []
+
+    with rg.reserve_output_path(tmp_path, 'b.docx', 'hash') as output_path:
+        output_path.write_bytes(b'ok')
+    assert output_path.name == 'b.docx'
+    assert [r['output'] for r in manifest_lines(rg, tmp_path)] == ['b.docx']
+
+
+def test_reserved_files_respect_umask(rg, tmp_path):
+    old_umask = os.umask(0o022)
+    try:
+        output_path = rg.OutputManifest(tmp_path).allocate('c.docx')
+    finally:
+        os.umask(old_umask)
+    assert output_path.stat().st_mode & 0o777 == 0o644
+
+
+# ============================================================================
+# IN-PLACE UPDATE
+# ============================================================================
+
+def test_update_docx_patches_only_changed_sections(rg, resume, tmp_path):
+    path = tmp_path / 'resume.docx'
+    rg.create_custom_resume(resume).save(str(path))
+    changed = copy.deepcopy(resume)
+    changed['experience'][0]['description'][0] = 'Rewrote the billing service'
+
+    result = rg.update_docx(path, changed)
+    assert result.rendered == 1 and result.removed == 0 and result.kept > 0
+
+    fresh = tmp_path / 'fresh.docx'
+    rg.create_custom_resume(changed).save(str(fresh))
+    with zipfile.ZipFile(path) as patched, zipfile.ZipFile(fresh) as expected:
+        assert patched.read('word/document.xml') == expected.read('word/document.xml')
+
+    assert rg.update_docx(path, changed).rendered == 0
+
+
+def test_update_docx_removes_dropped_sections(rg, resume, tmp_path):
+    path = tmp_path / 'resume.docx'
+    rg.create_custom_resume(resume).save(str(path))
+    result = rg.update_docx(path, dict(resume, projects=[]))
+    assert result.removed > 0 or result.rendered > 0
+    with zipfile.ZipFile(path) as patched:
+        assert b'PROJECTS' not in patched.read('word/document.xml')
+
+
+def test_update_docx_rejects_other_documents(rg, resume, tmp_path):
+    rg.load_docx()
+    path = tmp_path / 'plain.docx'
+    rg.Document().save(str(path))
+    with pytest.raises(rg.DocxUpdateError):
+        rg.update_docx(path, resume)
+
+
+# ============================================================================
+# AUTO-FIT
+# ============================================================================
+
+def test_auto_fit_leaves_fitting_resume_alone(rg, resume):
+    result = rg.auto_fit(resume, 10)
+    assert result.data is resume and result.notes == []
+
+
+def test_auto_fit_trims_until_target_is_reached(rg, resume):
+    original = copy.deepcopy(resume)
+    result = rg.auto_fit(resume, 2)
+    assert result.estimate.pages <= 2
+    assert any(note.startswith('removed') for note in result.notes)
+    assert resume == original
+    for section in ('experience', 'projects'):
+        for entry in result.data[section]:
+            assert len(entry['description']) >= rg.FIT_MIN_BULLETS
+
+
+def test_auto_fit_stops_when_target_is_out_of_reach(rg, resume):
+    result = rg.auto_fit(resume, 1)
+    assert result.data is resume
+    assert result.estimate.pages > 1
+    assert not any(note.startswith('removed') for note in result.notes)
+    assert 'none removed' in result.notes[-1]
+
+
+# ============================================================================
+# SCHEMA VALIDATION
+# ============================================================================
+
+def test_validation_reports_every_error_with_its_path(rg):
+    data = {'personal': {'name': 3}, 'experience': [{'title': 1, 'description': [1]}], 'skills': 'x'}
+    with pytest.raises(rg.ResumeValidationError) as excinfo:
+        rg.validate_resume(data)
+    assert excinfo.value.errors == [
+        '$.personal.name: expected string, got number',
+        '$.experience[0].title: expected string, got number',
+        '$.experience[0].description[0]: expected string, got number',
+        '$.skills: expected array or null, got string',
+    ]
+
+
+def test_validation_accepts_sample_and_null_sections(rg, resume):
+    rg.validate_resume(resume)
+    rg.validate_resume(dict(resume, projects=None, skills=None))
+
+
+def test_validation_rejects_non_object(rg):
+    with pytest.raises(rg.ResumeValidationError):
+        rg.validate_resume([])
+
+
+# ============================================================================
+# RENDER CACHE
+# ============================================================================
+
+def test_cache_key_depends_on_data_format_and_style(rg, resume, tmp_path):
+    cache = rg.RenderCache(tmp_path)
+    key = cache.key_for(resume)
+    assert key == cache.key_for(copy.deepcopy(resume))
+    assert key != cache.key_for(dict(resume, skills=[]))
+    assert key != cache.key_for(resume, 'html')
+    assert key != cache.key_for(resume, style=rg.default_style().with_values({'CONTENT_FONT_SIZE': 10}))
+
+
+def test_cache_key_depends_on_deterministic_output(rg, resume, tmp_path, monkeypatch):
+    cache = rg.RenderCache(tmp_path)
+    monkeypatch.delenv(rg.SOURCE_DATE_EPOCH_ENV_VAR, raising=False)
+    normal = cache.key_for(resume)
+    monkeypatch.setattr(rg, 'DETERMINISTIC_OUTPUT', True)
+    deterministic = cache.key_for(resume)
+    monkeypatch.setenv(rg.SOURCE_DATE_EPOCH_ENV_VAR, '1700000000')
+    assert len({normal, deterministic, cache.key_for(resume)}) == 3
+
+
+def test_cache_key_depends_on_compression(rg, resume, tmp_path, monkeypatch):
+    cache = rg.RenderCache(tmp_path)
+    keys = set()
+    for level in (None, 0, 9):
+        monkeypatch.setattr(rg, 'DOCX_COMPRESSION', level)
+        keys.add(cache.key_for(resume))
+    assert len(keys) == 3
+
+
+def test_cache_files_use_the_format_extension(rg, resume, tmp_path):
+    cache = rg.RenderCache(tmp_path)
+    for output_format in ('docx', 'html', 'txt', 'md'):
+        key = cache.key_for(resume, output_format)
+        cache.store(key, output_format.encode())
+        assert (tmp_path / key).suffix == '.' + output_format
+        assert cache.get(key) == output_format.encode()
+    assert rg.RenderCache(tmp_path)._load_entries().keys() == {p.name for p in tmp_path.iterdir()}
+
+
+def test_cache_evicts_least_recently_used(rg, tmp_path):
+    cache = rg.RenderCache(tmp_path, max_mb=2.5 / 1024)
+    cache.store('old.docx', b'x' * 1024)
+    cache.store('new.docx', b'x' * 1024)
+    cache.store('newest.docx', b'x' * 1024)
+    assert cache.get('old.docx') is None
+    assert cache.get('newest.docx') is not None
+    assert cache.evictions == 1
+
+
+# ============================================================================
+# WATCH MODE
+# ============================================================================
+
+def write_json(path, data):
+    path.write_text(json.dumps(data), encoding='utf-8')
+
+
+def watch_results(watcher):
+    return [(Path(path).name, error is None) for path, _, error, _, _ in watcher.poll()]
+
+
+def test_watcher_reports_clash_and_renders_once_it_clears(rg, resume, tmp_path):
+    watched = tmp_path / 'watched'
+    watched.mkdir()
+    write_json(watched / 'a.json', resume)
+    watcher = rg.JsonWatcher(watched, tmp_path / 'out', debounce=0, output_format='docx,txt')
+    watcher.snapshot()
+
+    write_json(watched / 'b.json', resume)
+    assert watch_results(watcher) == [('b.json', False)]
+    assert watch_results(watcher) == []
+
+    (watched / 'a.json').unlink()
+    assert watch_results(watcher) == [('b.json', True)]
+    name = rg.build_output_name(resume, 'docx')
+    assert (tmp_path / 'out' / name).exists()
+    assert (tmp_path / 'out' / name).with_suffix('.txt').exists()
+
+
+def test_watcher_renders_clash_found_at_startup_after_rename(rg, resume, tmp_path):
+    watched = tmp_path / 'watched'
+    watched.mkdir()
+    write_json(watched / 'a.json', resume)
+    write_json(watched / 'b.json', resume)
+    watcher = rg.JsonWatcher(watched, tmp_path / 'out', debounce=0)
+    watcher.snapshot()
+
+    time.sleep(0.01)
+    renamed = dict(resume, personal=dict(resume['personal'], company_name='Other Corp'))
+    write_json(watched / 'a.json', renamed)
+    assert watch_results(watcher) == [('a.json', True)]
+    assert watch_results(watcher) == [('b.json', True)]
+
+
+def test_watcher_skips_unchanged_saves(rg, resume, tmp_path):
+    watched = tmp_path / 'watched'
+    watched.mkdir()
+    write_json(watched / 'a.json', resume)
+    watcher = rg.JsonWatcher(watched, tmp_path / 'out', debounce=0)
+    watcher.snapshot()
+    time.sleep(0.01)
+    os.utime(watched / 'a.json')
+    assert watch_results(watcher) == []